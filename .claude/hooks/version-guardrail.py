@@ -19,6 +19,9 @@ import json
 import re
 import sys
 
+# Matches: version: 1.0.0, version: "1.0.0", version: '1.0.0'
+_VERSION_RE = re.compile(r'version:\s*["\']?\d')
+
 
 def deny_edit(reason: str) -> None:
     """Output JSON to deny the edit and exit."""
@@ -29,25 +32,37 @@ def deny_edit(reason: str) -> None:
             "permissionDecisionReason": reason,
         }
     }
-    print(json.dumps(output, indent=2))
+    print(json.dumps(output))
     sys.exit(0)
 
 
 def main() -> None:
     # Read input from stdin
+    raw = sys.stdin.read()
+
+    # Only Edit is guarded; skip parsing large Write payloads entirely
+    if '"Edit"' not in raw:
+        sys.exit(0)
+
     try:
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(raw)
     except json.JSONDecodeError:
         sys.exit(0)  # Allow if we can't parse input
 
+    if input_data.get("tool_name") != "Edit":
+        sys.exit(0)
+
     tool_input = input_data.get("tool_input", {})
     file_path = tool_input.get("file_path", "")
     old_string = tool_input.get("old_string", "")
     new_string = tool_input.get("new_string", "")
-    content = tool_input.get("content", "")
+
+    # Nothing to guard unless the edit touches a version token
+    if "version" not in old_string and "version" not in new_string:
+        return
 
     # Check JSON files (plugin.json, marketplace.json)
-    if re.search(r"(plugin\.json|marketplace\.json)$", file_path):
+    if file_path.endswith(("plugin.json", "marketplace.json")):
         # For Edit tool: check if old_string or new_string contains version pattern
         if '"version"' in old_string or '"version"' in new_string:
             deny_edit(
@@ -60,10 +75,9 @@ def main() -> None:
     # Check SKILL.md files for frontmatter version fields
     if file_path.endswith("SKILL.md"):
         # For Edit tool: check for version in YAML frontmatter
-        # Matches: version: 1.0.0, version: "1.0.0", version: '1.0.0'
-        version_pattern = r'version:\s*["\']?\d'
-
-        if re.search(version_pattern, old_string) or re.search(version_pattern, new_string):
+        if ("version" in old_string and _VERSION_RE.search(old_string)) or (
+            "version" in new_string and _VERSION_RE.search(new_string)
+        ):
             deny_edit(
                 "🚫 BLOCKED: Manual version edits in SKILL.md frontmatter are not allowed. "
                 "Versions are managed by the automated release process. "
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+#
+# Check that the Limelight Numba kernels match the NumPy batch path
+# Usage: uv run --with numpy --with numba .claude/scripts/check-limelight-kernels.py
+#
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "plugins/limelight/skills/limelight/scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import convert  # noqa: E402
+
+
+def main() -> int:
+    rng = np.random.default_rng(0)
+    edges = np.array([0.0, -0.0, np.pi, -np.pi, 2 * np.pi, -2 * np.pi, 1e-300,
+                      1e12, -1e12, np.inf, -np.inf, np.nan])
+    angles = np.concatenate([edges, rng.uniform(-1e4, 1e4, 100_000)])
+    ty = np.concatenate([edges, [-20.0, 70.0, 110.0], rng.uniform(-90.0, 90.0, 100_000)])
+
+    failures = []
+    got = convert.normalize_radians_batch(angles, use_numba=True)
+    want = convert.normalize_radians_batch(angles)
+    if not np.array_equal(got, want, equal_nan=True):
+        failures.append("normalize_radians_batch")
+
+    for args in [(12.0, 20.0, 30.0), (12.0, -20.0, 30.0), (30.0, 0.0, 30.0)]:
+        got = convert.calculate_distance_batch(ty, *args, use_numba=True)
+        want = convert.calculate_distance_batch(ty, *args)
+        if not np.allclose(got, want, rtol=1e-12, atol=0.0, equal_nan=True):
+            failures.append(f"calculate_distance_batch{args}")
+
+    for name in failures:
+        print(f"MISMATCH: {name}")
+    if failures:
+        return 1
+    print("Numba kernels match NumPy path")
+    return 0
+
+
+if __name__ == "__main__":
+    # inf/nan edge inputs are expected; don't warn about them
+    with np.errstate(invalid="ignore"):
+        sys.exit(main())
@@ -16,16 +16,43 @@ Examples:
 
 import sys
 import math
+import functools
+from typing import TYPE_CHECKING, Any, Callable, Final, List, Tuple
+
+if TYPE_CHECKING:
+    import numpy
+    from numpy.typing import ArrayLike, NDArray
+
+    FloatArray = NDArray[numpy.float64]
+    IntArray = NDArray[numpy.int64]
 
 # Constants
 FIELD_SIZE_INCHES = 144.0
 FIELD_CENTER_INCHES = 72.0
-INCHES_PER_METER = 39.3701
-METERS_PER_INCH = 0.0254
+METERS_PER_INCH = 0.0254  # exact, by definition of the inch
+INCHES_PER_METER = 1.0 / METERS_PER_INCH
 DEFAULT_TICKS_PER_DEGREE = 10.0
 
+_PI: Final = math.pi
+_TAU: Final = math.tau
+_RAD_PER_DEG: Final = math.pi / 180.0
+_DEG_PER_RAD: Final = 180.0 / math.pi
+
+# 45° sectors counter-clockwise from +X; index -k is k sectors clockwise
+_DIRECTIONS = (
+    "Right (+X)",
+    "Right-Back",
+    "Back (+Y)",
+    "Left-Back",
+    "Left (-X)",
+    "Left-Audience",
+    "Audience (-Y)",
+    "Right-Audience",
+)
+
 
-def botpose_to_pedro(x_meters: float, y_meters: float, yaw_degrees: float) -> tuple:
+def botpose_to_pedro(x_meters: float, y_meters: float,
+                     yaw_degrees: float) -> Tuple[float, float, float]:
     """
     Convert Limelight botpose (FTC coordinates) to Pedro Pathing pose.
 
@@ -34,27 +61,152 @@ def botpose_to_pedro(x_meters: float, y_meters: float, yaw_degrees: float) -> tu
     """
     pedro_x = (x_meters * INCHES_PER_METER) + FIELD_CENTER_INCHES
     pedro_y = (y_meters * INCHES_PER_METER) + FIELD_CENTER_INCHES
-    heading_rad = math.radians(yaw_degrees)
+    heading_rad = yaw_degrees * _RAD_PER_DEG
     return pedro_x, pedro_y, heading_rad
 
 
-def pedro_to_ftc(pedro_x: float, pedro_y: float, heading_rad: float) -> tuple:
+def pedro_to_ftc(pedro_x: float, pedro_y: float,
+                 heading_rad: float) -> Tuple[float, float, float]:
     """
     Convert Pedro coordinates to FTC/Limelight coordinates.
     """
     ftc_x = (pedro_x - FIELD_CENTER_INCHES) * METERS_PER_INCH
     ftc_y = (pedro_y - FIELD_CENTER_INCHES) * METERS_PER_INCH
-    heading_deg = math.degrees(heading_rad)
+    heading_deg = heading_rad * _DEG_PER_RAD
     return ftc_x, ftc_y, heading_deg
 
 
+def _require_numpy() -> Any:
+    """Import NumPy on demand so the scalar CLI stays stdlib-only."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "numpy is required for batch conversions "
+            "(run with: uv run --with numpy <script>)"
+        ) from e
+    return numpy
+
+
+# Numba is opt-in (use_numba=True on the batch helpers): compiling costs about
+# a second, which only pays off for very large arrays. Each core mirrors its
+# NumPy counterpart operation for operation and fastmath stays off, so both
+# paths return the same values (and distance can still return inf).
+def _calc_distance_core(ty: float, cam_h: float, cam_angle: float, tgt_h: float) -> float:
+    angle_rad = (cam_angle + ty) * _RAD_PER_DEG
+    s = math.sin(angle_rad)
+    if abs(s) < 1e-9:
+        return math.inf
+    return (tgt_h - cam_h) * math.cos(angle_rad) / s
+
+
+def _normalize_radians_core(angle: float) -> float:
+    # Same floored modulo as np.remainder in the NumPy path
+    return (angle + _PI) % _TAU - _PI
+
+
+def _calc_distance_numpy(ty_degrees: "FloatArray", camera_height_in: float,
+                         camera_angle_deg: float, target_height_in: float) -> "FloatArray":
+    np = _require_numpy()
+    angle_rad = (camera_angle_deg + ty_degrees) * _RAD_PER_DEG
+    s = np.sin(angle_rad)
+    c = np.cos(angle_rad)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dist = (target_height_in - camera_height_in) * c / s
+    result: "FloatArray" = np.where(np.abs(s) < 1e-9, np.inf, dist)
+    return result
+
+
+def _normalize_radians_numpy(angles: "FloatArray") -> "FloatArray":
+    np = _require_numpy()
+    result: "FloatArray" = np.remainder(angles + _PI, _TAU) - _PI
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_kernels() -> Tuple[Callable[..., None], Callable[..., None]]:
+    """Compile the Numba batch kernels once. Returns (distance_kernel, normalize_kernel)."""
+    try:
+        import numba
+    except ImportError as e:
+        raise ImportError(
+            "numba is required for use_numba=True "
+            "(run with: uv run --with numpy --with numba <script>)"
+        ) from e
+    distance_core: Callable[[float, float, float, float], float] = (
+        numba.njit(cache=True)(_calc_distance_core))
+    normalize_core: Callable[[float], float] = numba.njit(cache=True)(_normalize_radians_core)
+
+    @numba.njit(cache=True, parallel=True)
+    def distance_kernel(ty: "FloatArray", cam_h: float, cam_angle: float,
+                        tgt_h: float, out: "FloatArray") -> None:
+        for i in numba.prange(ty.shape[0]):
+            out[i] = distance_core(ty[i], cam_h, cam_angle, tgt_h)
+
+    @numba.njit(cache=True, parallel=True)
+    def normalize_kernel(angles: "FloatArray", out: "FloatArray") -> None:
+        for i in numba.prange(angles.shape[0]):
+            out[i] = normalize_core(angles[i])
+
+    return distance_kernel, normalize_kernel
+
+
+def botpose_to_pedro_batch(xy_m: "ArrayLike",
+                           yaw_deg: "ArrayLike") -> Tuple["FloatArray", "FloatArray"]:
+    """
+    Convert many Limelight botposes to Pedro poses at once.
+
+    xy_m: array-like of shape (N, 2), meters
+    yaw_deg: array-like of shape (N,), degrees
+    Returns (pedro_xy, heading_rad) as NumPy arrays of shape (N, 2) and (N,).
+    """
+    np = _require_numpy()
+    # Scale and offset in one output buffer (no temporary array)
+    pedro_xy: "FloatArray" = np.multiply(np.asarray(xy_m, dtype=np.float64), INCHES_PER_METER)
+    np.add(pedro_xy, FIELD_CENTER_INCHES, out=pedro_xy)
+    heading_rad: "FloatArray" = np.deg2rad(np.asarray(yaw_deg, dtype=np.float64))
+    return pedro_xy, heading_rad
+
+
+def pedro_to_ftc_batch(pedro_xy: "ArrayLike",
+                       heading_rad: "ArrayLike") -> Tuple["FloatArray", "FloatArray"]:
+    """
+    Convert many Pedro poses to FTC/Limelight coordinates at once.
+
+    pedro_xy: array-like of shape (N, 2), inches
+    heading_rad: array-like of shape (N,), radians
+    Returns (ftc_xy, heading_deg) as NumPy arrays of shape (N, 2) and (N,).
+    """
+    np = _require_numpy()
+    ftc_xy: "FloatArray" = np.subtract(np.asarray(pedro_xy, dtype=np.float64), FIELD_CENTER_INCHES)
+    np.multiply(ftc_xy, METERS_PER_INCH, out=ftc_xy)
+    heading_deg: "FloatArray" = np.rad2deg(np.asarray(heading_rad, dtype=np.float64))
+    return ftc_xy, heading_deg
+
+
 def tx_to_turret_ticks(tx_degrees: float, ticks_per_degree: float = DEFAULT_TICKS_PER_DEGREE) -> int:
     """
     Convert Limelight tx (degrees) to turret encoder ticks.
 
     tx positive = target to the left = rotate turret left (positive ticks)
     """
-    return int(tx_degrees * ticks_per_degree)
+    return int(round(tx_degrees * ticks_per_degree))
+
+
+def tx_to_turret_ticks_batch(tx_degrees: "ArrayLike",
+                             ticks_per_degree: float = DEFAULT_TICKS_PER_DEGREE) -> "IntArray":
+    """
+    Convert an array of Limelight tx samples (degrees) to turret encoder ticks.
+
+    Raises ValueError if any sample is NaN or inf (e.g. no target), like the
+    scalar tx_to_turret_ticks; filter those samples out before calling.
+    """
+    np = _require_numpy()
+    scaled = np.asarray(tx_degrees, dtype=np.float64) * ticks_per_degree
+    if not np.isfinite(scaled).all():
+        raise ValueError("tx samples must be finite (NaN/inf means no target)")
+    ticks: "IntArray" = np.rint(scaled).astype(np.int64)
+    return ticks
 
 
 def calculate_distance(ty_degrees: float, camera_height_in: float,
@@ -63,98 +215,156 @@ def calculate_distance(ty_degrees: float, camera_height_in: float,
     Calculate distance to target using ty and known heights.
 
     Uses: distance = (targetHeight - cameraHeight) / tan(cameraAngle + ty)
+    Scalar only; use calculate_distance_batch for arrays of ty samples.
     """
-    angle_rad = math.radians(camera_angle_deg + ty_degrees)
-    if abs(math.tan(angle_rad)) < 0.001:
+    angle_rad = (camera_angle_deg + ty_degrees) * _RAD_PER_DEG
+    s = math.sin(angle_rad)
+    if abs(s) < 1e-9:
         return float('inf')
-    return (target_height_in - camera_height_in) / math.tan(angle_rad)
+    return (target_height_in - camera_height_in) * math.cos(angle_rad) / s
+
+
+def calculate_distance_batch(ty_degrees: "ArrayLike", camera_height_in: float,
+                             camera_angle_deg: float, target_height_in: float,
+                             use_numba: bool = False) -> "FloatArray":
+    """
+    Calculate distance to target for an array of ty samples.
+
+    Uses: distance = (targetHeight - cameraHeight) * cos(a) / sin(a)
+    Samples where sin(a) is ~0 (camera looking level) return inf.
+    use_numba=True runs a compiled parallel kernel (requires numba).
+    """
+    np = _require_numpy()
+    ty: "FloatArray" = np.asarray(ty_degrees, dtype=np.float64)
+    if not use_numba:
+        return _calc_distance_numpy(ty, camera_height_in, camera_angle_deg, target_height_in)
+    flat = np.ravel(ty)
+    out: "FloatArray" = np.empty_like(flat)
+    _numba_kernels()[0](flat, float(camera_height_in), float(camera_angle_deg),
+                        float(target_height_in), out)
+    return out.reshape(ty.shape)
 
 
 def normalize_radians(angle: float) -> float:
-    """Normalize angle to [-PI, PI] radians."""
-    while angle > math.pi:
-        angle -= 2 * math.pi
-    while angle < -math.pi:
-        angle += 2 * math.pi
-    return angle
+    """Normalize angle to [-PI, PI] radians. Raises ValueError for +/-inf."""
+    return math.remainder(angle, _TAU)
+
+
+def normalize_radians_batch(angles: "ArrayLike", use_numba: bool = False) -> "FloatArray":
+    """
+    Normalize an array of angles to [-PI, PI) radians.
+
+    use_numba=True runs a compiled parallel kernel (requires numba).
+    """
+    np = _require_numpy()
+    values: "FloatArray" = np.asarray(angles, dtype=np.float64)
+    if not use_numba:
+        return _normalize_radians_numpy(values)
+    flat = np.ravel(values)
+    out: "FloatArray" = np.empty_like(flat)
+    _numba_kernels()[1](flat, out)
+    return out.reshape(values.shape)
 
 
 def heading_to_direction(radians: float) -> str:
     """Convert heading to human-readable direction."""
-    degrees = math.degrees(normalize_radians(radians))
-    if -22.5 <= degrees <= 22.5:
-        return "Right (+X)"
-    elif 22.5 < degrees <= 67.5:
-        return "Right-Back"
-    elif 67.5 < degrees <= 112.5:
-        return "Back (+Y)"
-    elif 112.5 < degrees <= 157.5:
-        return "Left-Back"
-    elif degrees > 157.5 or degrees < -157.5:
-        return "Left (-X)"
-    elif -157.5 <= degrees < -112.5:
-        return "Left-Audience"
-    elif -112.5 <= degrees < -67.5:
-        return "Audience (-Y)"
-    elif -67.5 <= degrees < -22.5:
-        return "Right-Audience"
-    return "Unknown"
-
-
-def print_usage():
+    if not math.isfinite(radians):
+        return "Unknown"
+    # Same wrap as normalize_radians, inlined: this runs once per pose sample
+    degrees = math.remainder(radians, _TAU) * _DEG_PER_RAD
+    # Count 45° sectors away from +X; a heading on an edge belongs to the
+    # sector nearer +X (so 22.5° is still "Right (+X)")
+    magnitude = abs(degrees)
+    if magnitude <= 22.5:
+        return _DIRECTIONS[0]
+    sector = math.ceil((magnitude - 22.5) / 45.0)
+    return _DIRECTIONS[sector if degrees > 0.0 else -sector]
+
+
+def heading_to_direction_batch(radians: "ArrayLike") -> List[str]:
+    """Convert headings to human-readable directions, one label per element (flattened)."""
+    np = _require_numpy()
+    values = np.ravel(np.asarray(radians, dtype=np.float64))
+    unknown = ~np.isfinite(values)
+    # fmod plus one exact +/-tau step reproduces math.remainder in the scalar path,
+    # so headings on a sector edge get the same label from both
+    wrapped = np.fmod(np.where(unknown, 0.0, values), _TAU)
+    wrapped = np.where(wrapped > _PI, wrapped - _TAU,
+                       np.where(wrapped < -_PI, wrapped + _TAU, wrapped))
+    degrees = wrapped * _DEG_PER_RAD
+    magnitude = np.abs(degrees)
+    sector = np.ceil(np.maximum(magnitude - 22.5, 0.0) / 45.0).astype(np.intp)
+    idx = np.where(degrees > 0.0, sector, -sector) % len(_DIRECTIONS)
+    idx = np.where(unknown, len(_DIRECTIONS), idx)
+    labels: List[str] = np.take(np.array(_DIRECTIONS + ("Unknown",)), idx).tolist()
+    return labels
+
+
+def print_usage() -> None:
     print(__doc__)
 
 
-def main():
+def _cmd_botpose_to_pedro(argv: List[str]) -> None:
+    if len(argv) != 5:
+        print("Usage: botpose-to-pedro <x_meters> <y_meters> <yaw_degrees>")
+        sys.exit(1)
+    x, y, yaw = float(argv[2]), float(argv[3]), float(argv[4])
+    px, py, ph = botpose_to_pedro(x, y, yaw)
+    print(f"Limelight botpose: ({x:.3f}m, {y:.3f}m) @ {yaw:.1f}°")
+    print(f"Pedro:             ({px:.2f}\", {py:.2f}\") @ {ph:.4f} rad")
+    print(f"Direction:         {heading_to_direction(ph)}")
+
+
+def _cmd_tx_to_turret(argv: List[str]) -> None:
+    if len(argv) < 3:
+        print("Usage: tx-to-turret <tx_degrees> [ticks_per_degree]")
+        sys.exit(1)
+    tx = float(argv[2])
+    tpd = float(argv[3]) if len(argv) > 3 else DEFAULT_TICKS_PER_DEGREE
+    ticks = tx_to_turret_ticks(tx, tpd)
+    direction = "LEFT" if tx > 0 else "RIGHT" if tx < 0 else "CENTER"
+    print(f"tx:              {tx:.2f}° ({direction})")
+    print(f"Ticks/degree:    {tpd:.1f}")
+    print(f"Turret ticks:    {ticks}")
+
+
+def _cmd_distance(argv: List[str]) -> None:
+    if len(argv) != 6:
+        print("Usage: distance <ty_degrees> <camera_height_in> <camera_angle_deg> <target_height_in>")
+        sys.exit(1)
+    ty = float(argv[2])
+    cam_h = float(argv[3])
+    cam_angle = float(argv[4])
+    target_h = float(argv[5])
+    dist = calculate_distance(ty, cam_h, cam_angle, target_h)
+    print(f"ty:            {ty:.2f}°")
+    print(f"Camera height: {cam_h:.1f}\"")
+    print(f"Camera angle:  {cam_angle:.1f}°")
+    print(f"Target height: {target_h:.1f}\"")
+    print(f"Distance:      {dist:.2f}\"")
+
+
+COMMANDS = {
+    "botpose-to-pedro": _cmd_botpose_to_pedro,
+    "tx-to-turret": _cmd_tx_to_turret,
+    "distance": _cmd_distance,
+}
+
+
+def main() -> None:
     if len(sys.argv) < 2:
         print_usage()
         sys.exit(1)
 
     command = sys.argv[1].lower()
+    handler = COMMANDS.get(command)
+    if handler is None:
+        print(f"Unknown command: {command}")
+        print_usage()
+        sys.exit(1)
 
     try:
-        if command == "botpose-to-pedro":
-            if len(sys.argv) != 5:
-                print("Usage: botpose-to-pedro <x_meters> <y_meters> <yaw_degrees>")
-                sys.exit(1)
-            x, y, yaw = float(sys.argv[2]), float(sys.argv[3]), float(sys.argv[4])
-            px, py, ph = botpose_to_pedro(x, y, yaw)
-            print(f"Limelight botpose: ({x:.3f}m, {y:.3f}m) @ {yaw:.1f}°")
-            print(f"Pedro:             ({px:.2f}\", {py:.2f}\") @ {ph:.4f} rad")
-            print(f"Direction:         {heading_to_direction(ph)}")
-
-        elif command == "tx-to-turret":
-            if len(sys.argv) < 3:
-                print("Usage: tx-to-turret <tx_degrees> [ticks_per_degree]")
-                sys.exit(1)
-            tx = float(sys.argv[2])
-            tpd = float(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_TICKS_PER_DEGREE
-            ticks = tx_to_turret_ticks(tx, tpd)
-            direction = "LEFT" if tx > 0 else "RIGHT" if tx < 0 else "CENTER"
-            print(f"tx:              {tx:.2f}° ({direction})")
-            print(f"Ticks/degree:    {tpd:.1f}")
-            print(f"Turret ticks:    {ticks}")
-
-        elif command == "distance":
-            if len(sys.argv) != 6:
-                print("Usage: distance <ty_degrees> <camera_height_in> <camera_angle_deg> <target_height_in>")
-                sys.exit(1)
-            ty = float(sys.argv[2])
-            cam_h = float(sys.argv[3])
-            cam_angle = float(sys.argv[4])
-            target_h = float(sys.argv[5])
-            dist = calculate_distance(ty, cam_h, cam_angle, target_h)
-            print(f"ty:            {ty:.2f}°")
-            print(f"Camera height: {cam_h:.1f}\"")
-            print(f"Camera angle:  {cam_angle:.1f}°")
-            print(f"Target height: {target_h:.1f}\"")
-            print(f"Distance:      {dist:.2f}\"")
-
-        else:
-            print(f"Unknown command: {command}")
-            print_usage()
-            sys.exit(1)
-
+        handler(sys.argv)
     except ValueError as e:
         print(f"Error parsing arguments: {e}")
         sys.exit(1)